@@ -0,0 +1,39 @@
+#----------------------------------------------------------------
+# Generated CMake target import file for configuration "Release".
+#----------------------------------------------------------------
+
+# Commands may need to know the format version.
+set(CMAKE_IMPORT_FILE_VERSION 1)
+
+# Import target "hashbrowns::hashbrowns_core" for configuration "Release"
+set_property(TARGET hashbrowns::hashbrowns_core APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(hashbrowns::hashbrowns_core PROPERTIES
+  IMPORTED_LINK_INTERFACE_LANGUAGES_RELEASE "CXX"
+  IMPORTED_LOCATION_RELEASE "${_IMPORT_PREFIX}/lib/libhashbrowns_core.a"
+  )
+
+list(APPEND _cmake_import_check_targets hashbrowns::hashbrowns_core )
+list(APPEND _cmake_import_check_files_for_hashbrowns::hashbrowns_core "${_IMPORT_PREFIX}/lib/libhashbrowns_core.a" )
+
+# Import target "hashbrowns::hashbrowns_structures" for configuration "Release"
+set_property(TARGET hashbrowns::hashbrowns_structures APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(hashbrowns::hashbrowns_structures PROPERTIES
+  IMPORTED_LINK_INTERFACE_LANGUAGES_RELEASE "CXX"
+  IMPORTED_LOCATION_RELEASE "${_IMPORT_PREFIX}/lib/libhashbrowns_structures.a"
+  )
+
+list(APPEND _cmake_import_check_targets hashbrowns::hashbrowns_structures )
+list(APPEND _cmake_import_check_files_for_hashbrowns::hashbrowns_structures "${_IMPORT_PREFIX}/lib/libhashbrowns_structures.a" )
+
+# Import target "hashbrowns::hashbrowns_benchmark" for configuration "Release"
+set_property(TARGET hashbrowns::hashbrowns_benchmark APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(hashbrowns::hashbrowns_benchmark PROPERTIES
+  IMPORTED_LINK_INTERFACE_LANGUAGES_RELEASE "CXX"
+  IMPORTED_LOCATION_RELEASE "${_IMPORT_PREFIX}/lib/libhashbrowns_benchmark.a"
+  )
+
+list(APPEND _cmake_import_check_targets hashbrowns::hashbrowns_benchmark )
+list(APPEND _cmake_import_check_files_for_hashbrowns::hashbrowns_benchmark "${_IMPORT_PREFIX}/lib/libhashbrowns_benchmark.a" )
+
+# Commands beyond this point should not need to know the version.
+set(CMAKE_IMPORT_FILE_VERSION)
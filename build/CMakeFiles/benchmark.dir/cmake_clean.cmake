@@ -0,0 +1,8 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/benchmark"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/benchmark.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
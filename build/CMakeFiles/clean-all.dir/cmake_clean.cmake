@@ -0,0 +1,8 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/clean-all"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang )
+  include(CMakeFiles/clean-all.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
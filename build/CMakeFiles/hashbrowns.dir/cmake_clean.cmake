@@ -0,0 +1,15 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/hashbrowns.dir/src/cli/cli_args.cpp.o"
+  "CMakeFiles/hashbrowns.dir/src/cli/cli_args.cpp.o.d"
+  "CMakeFiles/hashbrowns.dir/src/cli/cli_handlers.cpp.o"
+  "CMakeFiles/hashbrowns.dir/src/cli/cli_handlers.cpp.o.d"
+  "CMakeFiles/hashbrowns.dir/src/main.cpp.o"
+  "CMakeFiles/hashbrowns.dir/src/main.cpp.o.d"
+  "hashbrowns"
+  "hashbrowns.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/hashbrowns.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
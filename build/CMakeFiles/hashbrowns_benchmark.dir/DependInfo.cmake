@@ -0,0 +1,24 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/benchmark/benchmark_baseline.cpp" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_baseline.cpp.o" "gcc" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_baseline.cpp.o.d"
+  "/root/package/src/benchmark/benchmark_io.cpp" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_io.cpp.o" "gcc" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_io.cpp.o.d"
+  "/root/package/src/benchmark/benchmark_suite.cpp" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_suite.cpp.o" "gcc" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_suite.cpp.o.d"
+  "/root/package/src/benchmark/regression_tester.cpp" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/regression_tester.cpp.o" "gcc" "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/regression_tester.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/build/CMakeFiles/hashbrowns_core.dir/DependInfo.cmake"
+  "/root/package/build/CMakeFiles/hashbrowns_structures.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
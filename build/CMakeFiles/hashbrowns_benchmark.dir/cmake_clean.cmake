@@ -0,0 +1,17 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_baseline.cpp.o"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_baseline.cpp.o.d"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_io.cpp.o"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_io.cpp.o.d"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_suite.cpp.o"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/benchmark_suite.cpp.o.d"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/regression_tester.cpp.o"
+  "CMakeFiles/hashbrowns_benchmark.dir/src/benchmark/regression_tester.cpp.o.d"
+  "libhashbrowns_benchmark.a"
+  "libhashbrowns_benchmark.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/hashbrowns_benchmark.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
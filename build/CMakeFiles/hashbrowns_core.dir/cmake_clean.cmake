@@ -0,0 +1,13 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/hashbrowns_core.dir/src/core/memory_manager.cpp.o"
+  "CMakeFiles/hashbrowns_core.dir/src/core/memory_manager.cpp.o.d"
+  "CMakeFiles/hashbrowns_core.dir/src/core/timer.cpp.o"
+  "CMakeFiles/hashbrowns_core.dir/src/core/timer.cpp.o.d"
+  "libhashbrowns_core.a"
+  "libhashbrowns_core.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/hashbrowns_core.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
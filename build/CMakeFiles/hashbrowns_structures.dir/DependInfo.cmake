@@ -0,0 +1,22 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/structures/dynamic_array.cpp" "CMakeFiles/hashbrowns_structures.dir/src/structures/dynamic_array.cpp.o" "gcc" "CMakeFiles/hashbrowns_structures.dir/src/structures/dynamic_array.cpp.o.d"
+  "/root/package/src/structures/hash_map.cpp" "CMakeFiles/hashbrowns_structures.dir/src/structures/hash_map.cpp.o" "gcc" "CMakeFiles/hashbrowns_structures.dir/src/structures/hash_map.cpp.o.d"
+  "/root/package/src/structures/linked_list.cpp" "CMakeFiles/hashbrowns_structures.dir/src/structures/linked_list.cpp.o" "gcc" "CMakeFiles/hashbrowns_structures.dir/src/structures/linked_list.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/build/CMakeFiles/hashbrowns_core.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,15 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/hashbrowns_structures.dir/src/structures/dynamic_array.cpp.o"
+  "CMakeFiles/hashbrowns_structures.dir/src/structures/dynamic_array.cpp.o.d"
+  "CMakeFiles/hashbrowns_structures.dir/src/structures/hash_map.cpp.o"
+  "CMakeFiles/hashbrowns_structures.dir/src/structures/hash_map.cpp.o.d"
+  "CMakeFiles/hashbrowns_structures.dir/src/structures/linked_list.cpp.o"
+  "CMakeFiles/hashbrowns_structures.dir/src/structures/linked_list.cpp.o.d"
+  "libhashbrowns_structures.a"
+  "libhashbrowns_structures.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/hashbrowns_structures.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,3 @@
+file(REMOVE_RECURSE
+  "libhashbrowns_structures.a"
+)
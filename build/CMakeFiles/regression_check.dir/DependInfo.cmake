@@ -0,0 +1,22 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/tools/regression_check.cpp" "CMakeFiles/regression_check.dir/tools/regression_check.cpp.o" "gcc" "CMakeFiles/regression_check.dir/tools/regression_check.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/build/CMakeFiles/hashbrowns_benchmark.dir/DependInfo.cmake"
+  "/root/package/build/CMakeFiles/hashbrowns_structures.dir/DependInfo.cmake"
+  "/root/package/build/CMakeFiles/hashbrowns_core.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,32 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/src/cli/cli_args.cpp" "CMakeFiles/unit_tests.dir/src/cli/cli_args.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/src/cli/cli_args.cpp.o.d"
+  "/root/package/tests/unit/main_tests.cpp" "CMakeFiles/unit_tests.dir/tests/unit/main_tests.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/main_tests.cpp.o.d"
+  "/root/package/tests/unit/test_benchmark_crossover.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_benchmark_crossover.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_benchmark_crossover.cpp.o.d"
+  "/root/package/tests/unit/test_dynamic_array.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_dynamic_array.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_dynamic_array.cpp.o.d"
+  "/root/package/tests/unit/test_hash_map.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_hash_map.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_hash_map.cpp.o.d"
+  "/root/package/tests/unit/test_json_output.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_json_output.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_json_output.cpp.o.d"
+  "/root/package/tests/unit/test_linked_list.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_linked_list.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_linked_list.cpp.o.d"
+  "/root/package/tests/unit/test_memory_tracker.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_memory_tracker.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_memory_tracker.cpp.o.d"
+  "/root/package/tests/unit/test_series_json.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_series_json.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_series_json.cpp.o.d"
+  "/root/package/tests/unit/test_stats.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_stats.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_stats.cpp.o.d"
+  "/root/package/tests/unit/test_timer.cpp" "CMakeFiles/unit_tests.dir/tests/unit/test_timer.cpp.o" "gcc" "CMakeFiles/unit_tests.dir/tests/unit/test_timer.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  "/root/package/build/CMakeFiles/hashbrowns_core.dir/DependInfo.cmake"
+  "/root/package/build/CMakeFiles/hashbrowns_structures.dir/DependInfo.cmake"
+  "/root/package/build/CMakeFiles/hashbrowns_benchmark.dir/DependInfo.cmake"
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,31 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/unit_tests.dir/src/cli/cli_args.cpp.o"
+  "CMakeFiles/unit_tests.dir/src/cli/cli_args.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/main_tests.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/main_tests.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_benchmark_crossover.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_benchmark_crossover.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_dynamic_array.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_dynamic_array.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_hash_map.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_hash_map.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_json_output.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_json_output.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_linked_list.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_linked_list.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_memory_tracker.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_memory_tracker.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_series_json.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_series_json.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_stats.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_stats.cpp.o.d"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_timer.cpp.o"
+  "CMakeFiles/unit_tests.dir/tests/unit/test_timer.cpp.o.d"
+  "unit_tests"
+  "unit_tests.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/unit_tests.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,8 @@
+# CMake generated Testfile for 
+# Source directory: /root/package
+# Build directory: /root/package/build
+# 
+# This file includes the relevant testing commands required for 
+# testing this directory and lists subdirectories to be tested as well.
+add_test(UnitTests "/root/package/build/unit_tests")
+set_tests_properties(UnitTests PROPERTIES  _BACKTRACE_TRIPLES "/root/package/CMakeLists.txt;167;add_test;/root/package/CMakeLists.txt;0;")
@@ -0,0 +1,43 @@
+# hashbrownsConfig.cmake - CMake package configuration file
+
+
+####### Expanded from @PACKAGE_INIT@ by configure_package_config_file() #######
+####### Any changes to this file will be overwritten by the next CMake run ####
+####### The input file was hashbrownsConfig.cmake.in                            ########
+
+get_filename_component(PACKAGE_PREFIX_DIR "${CMAKE_CURRENT_LIST_DIR}/../../../" ABSOLUTE)
+
+macro(set_and_check _var _file)
+  set(${_var} "${_file}")
+  if(NOT EXISTS "${_file}")
+    message(FATAL_ERROR "File or directory ${_file} referenced by variable ${_var} does not exist !")
+  endif()
+endmacro()
+
+macro(check_required_components _NAME)
+  foreach(comp ${${_NAME}_FIND_COMPONENTS})
+    if(NOT ${_NAME}_${comp}_FOUND)
+      if(${_NAME}_FIND_REQUIRED_${comp})
+        set(${_NAME}_FOUND FALSE)
+      endif()
+    endif()
+  endforeach()
+endmacro()
+
+####################################################################################
+
+# Ensure that dependencies are found (none external required currently)
+# If you add dependencies, use find_dependency(SomePackage REQUIRED)
+include(CMakeFindDependencyMacro)
+
+# Set package version variables
+set_and_check(hashbrowns_INCLUDE_DIR "${PACKAGE_PREFIX_DIR}/include/hashbrowns")
+
+# Exported targets
+include("${CMAKE_CURRENT_LIST_DIR}/hashbrownsTargets.cmake")
+
+# Provide convenient imported target alias if desired
+# Users should link against targets already exported, e.g., hashbrowns::core, hashbrowns::structures, hashbrowns::benchmark
+
+# Backward-compat variables (optional)
+set(hashbrowns_FOUND TRUE)
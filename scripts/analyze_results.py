@@ -1,49 +1,71 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import operator
 import os
+import sys
 from collections import defaultdict
 
+BENCH_COLUMNS = ("structure", "insert_ms_mean", "search_ms_mean", "remove_ms_mean", "memory_bytes")
+CROSS_COLUMNS = ("operation", "a", "b", "size_at_crossover")
 
-def read_csv(path):
-    rows = []
+
+def read_csv(path, columns):
+    # Stream the requested columns as tuples; consumers make a single pass
     if not os.path.exists(path):
-        return rows
+        return
     with open(path, newline="") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            rows.append(r)
-    return rows
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [c for c in columns if c not in header]
+        if missing:
+            print(f"[ERROR] {path}: missing column(s) {', '.join(missing)}", file=sys.stderr)
+            return
+        get = operator.itemgetter(*(header.index(c) for c in columns))
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+            yield get(row)
 
 
 def summarize_bench(rows):
-    # Expect columns from benchmark CSV
-    print("\n=== Benchmark Summary ===")
-    if not rows:
-        print("(no data)")
-        return
+    # Expect columns from benchmark CSV; buffer lines and write once
+    out = ["\n=== Benchmark Summary ==="]
     for r in rows:
+        st, ins, sea, rem, mem = r
         try:
-            print(f"- {r['structure']}: insert={float(r['insert_ms_mean']):.3f} ms, "
-                  f"search={float(r['search_ms_mean']):.3f} ms, remove={float(r['remove_ms_mean']):.3f} ms, "
-                  f"mem={int(float(r['memory_bytes']))} bytes")
+            out.append(f"- {st}: insert={float(ins):.3f} ms, "
+                       f"search={float(sea):.3f} ms, remove={float(rem):.3f} ms, "
+                       f"mem={int(float(mem))} bytes")
         except Exception:
-            print(f"- {r}")
+            out.append(f"- {dict(zip(BENCH_COLUMNS, r))}")
+    if len(out) == 1:
+        out.append("(no data)")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def summarize_crossovers(rows):
     # Expect columns: operation,a,b,size_at_crossover
     print("\n=== Crossover Points (approx) ===")
-    if not rows:
-        print("(no data)")
-        return
     # Group by operation
     ops = defaultdict(list)
-    for r in rows:
+    for op, a, b, size in rows:
+        if not op or not size:
+            continue
         try:
-            ops[r['operation']].append((r['a'], r['b'], int(float(r['size_at_crossover']))))
-        except Exception:
-            pass
+            size = int(float(size))
+        except (ValueError, OverflowError):
+            print(f"[WARN] skipping crossover {op} {a} vs {b}: bad size {size!r}", file=sys.stderr)
+            continue
+        ops[op].append((a, b, size))
+    if not ops:
+        print("(no data)")
+        return
     for op, lst in ops.items():
         lst.sort(key=lambda x: x[2])
         print(f"{op}:")
@@ -57,8 +79,8 @@ def main():
     ap.add_argument("--cross-csv", default=os.path.join("build", "crossover_results.csv"))
     args = ap.parse_args()
 
-    bench = read_csv(args.bench_csv)
-    cross = read_csv(args.cross_csv)
+    bench = read_csv(args.bench_csv, BENCH_COLUMNS)
+    cross = read_csv(args.cross_csv, CROSS_COLUMNS)
 
     summarize_bench(bench)
     summarize_crossovers(cross)
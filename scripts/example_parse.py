@@ -21,16 +21,77 @@ Exit codes:
 """
 
 from __future__ import annotations
-import json, sys, argparse, statistics
-from typing import Any, Dict, List
+import json, sys, argparse, operator, statistics
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+try:
+    import orjson  # optional faster parser
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    # orjson is stricter than json (no NaN/Infinity, 64-bit ints only), so
+    # anything it rejects is re-parsed with json to keep the same verdicts
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; fall back to statistics.median
+    np = None
 
 EXPECTED_SCHEMA = 1  # increment if schema.md evolves
 
+BENCH_FIELDS = ('structure', 'insert_ms_mean', 'search_ms_mean', 'remove_ms_mean', 'memory_bytes')
+BENCH_DEFAULTS: Dict[str, Any] = {**dict.fromkeys(BENCH_FIELDS), 'structure': '?'}
+_bench_row = operator.itemgetter(*BENCH_FIELDS)
+
+
+# One benchmark result; slotted so rows carry no per-instance dict
+@dataclass
+class BenchRow:
+    __slots__ = ('structure', 'insert_ms', 'search_ms', 'remove_ms', 'memory_bytes')
+    structure: str
+    insert_ms: Optional[float]
+    search_ms: Optional[float]
+    remove_ms: Optional[float]
+    memory_bytes: Optional[int]
+
+
+def _to_float(v: Any) -> Optional[float]:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(v: Any) -> Optional[int]:
+    try:
+        return int(float(v))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def parse_bench_rows(blob: Dict[str, Any]) -> List[BenchRow]:
+    # Fill in defaults only for rows that are missing fields; values that
+    # do not parse become None, which fmt() renders as '-'
+    rows = []
+    for r in blob['results']:
+        st, ins, sea, rem, mem = _bench_row(r if r.keys() >= BENCH_DEFAULTS.keys() else {**BENCH_DEFAULTS, **r})
+        rows.append(BenchRow(str(st), _to_float(ins), _to_float(sea), _to_float(rem), _to_int(mem)))
+    return rows
+
 
 def load_json(path: str) -> Dict[str, Any]:
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(path, 'rb') as f:
+            return _loads(f.read())
     except OSError as e:
         print(f"error: unable to open '{path}': {e}", file=sys.stderr)
         sys.exit(3)
@@ -39,18 +100,6 @@ def load_json(path: str) -> Dict[str, Any]:
         sys.exit(3)
 
 
-def is_benchmark_blob(blob: Dict[str, Any]) -> bool:
-    return 'results' in blob and isinstance(blob['results'], list) and 'meta' in blob
-
-
-def is_crossover_blob(blob: Dict[str, Any]) -> bool:
-    return 'crossovers' in blob and isinstance(blob['crossovers'], list)
-
-
-def is_series_blob(blob: Dict[str, Any]) -> bool:
-    return 'series' in blob and isinstance(blob['series'], list)
-
-
 def validate_schema(blob: Dict[str, Any]):
     meta = blob.get('meta', {})
     sv = meta.get('schema_version')
@@ -59,60 +108,65 @@ def validate_schema(blob: Dict[str, Any]):
 
 
 def fmt(f: Any, digits: int = 2) -> str:
+    if isinstance(f, (int, float)):
+        return f"{f:.{digits}f}"
     try:
         return f"{float(f):.{digits}f}"
     except (ValueError, TypeError):
         return "-"
 
 
+def median(vals: List[Optional[float]]) -> Optional[float]:
+    # Missing timings are skipped; None (rendered as '-') if nothing is left
+    vals = [v for v in vals if v is not None]
+    if not vals:
+        return None
+    if np is None:
+        return statistics.median(vals)
+    # np.median selects via partitioning instead of a full sort
+    return float(np.median(np.fromiter(vals, dtype=np.float64, count=len(vals))))
+
+
 def render_benchmark(blob: Dict[str, Any], args: argparse.Namespace):
-    rows = []
-    for r in blob['results']:
-        rows.append({
-            'structure': r.get('structure','?'),
-            'insert_ms': r.get('insert_ms_mean'),
-            'search_ms': r.get('search_ms_mean'),
-            'remove_ms': r.get('remove_ms_mean'),
-            'memory_bytes': r.get('memory_bytes'),
-        })
     op_filter = args.operation
+    want_insert = op_filter in (None, 'insert')
+    want_search = op_filter in (None, 'search')
+    want_remove = op_filter in (None, 'remove')
+    want_memory = op_filter is None
     headers = ['Structure']
-    if op_filter in (None, 'insert'): headers.append('Insert(ms)')
-    if op_filter in (None, 'search'): headers.append('Search(ms)')
-    if op_filter in (None, 'remove'): headers.append('Remove(ms)')
-    if op_filter is None: headers.append('Memory(bytes)')
-
-    if args.csv:
-        print(','.join(x.lower().replace('(ms)','').replace('(bytes)','') for x in headers))  # header row
-        for r in rows:
-            parts = [r['structure']]
-            if op_filter in (None, 'insert'): parts.append(fmt(r['insert_ms']))
-            if op_filter in (None, 'search'): parts.append(fmt(r['search_ms']))
-            if op_filter in (None, 'remove'): parts.append(fmt(r['remove_ms']))
-            if op_filter is None: parts.append(str(r['memory_bytes'] or 0))
-            print(','.join(parts))
-        return
+    if want_insert: headers.append('Insert(ms)')
+    if want_search: headers.append('Search(ms)')
+    if want_remove: headers.append('Remove(ms)')
+    if want_memory: headers.append('Memory(bytes)')
 
+    # Single pass: format each row once, tracking column widths as we go
     col_widths = [len(h) for h in headers]
     rendered = []
-    for r in rows:
-        cols = [r['structure']]
-        if op_filter in (None, 'insert'): cols.append(fmt(r['insert_ms']))
-        if op_filter in (None, 'search'): cols.append(fmt(r['search_ms']))
-        if op_filter in (None, 'remove'): cols.append(fmt(r['remove_ms']))
-        if op_filter is None: cols.append(str(r['memory_bytes'] or 0))
+    for r in parse_bench_rows(blob):
+        cols = [r.structure]
+        if want_insert: cols.append(fmt(r.insert_ms))
+        if want_search: cols.append(fmt(r.search_ms))
+        if want_remove: cols.append(fmt(r.remove_ms))
+        if want_memory: cols.append(str(r.memory_bytes or 0))
         rendered.append(cols)
         for i,c in enumerate(cols): col_widths[i] = max(col_widths[i], len(c))
 
-    line = '  '.join(h.ljust(col_widths[i]) for i,h in enumerate(headers))
-    print(line)
-    for cols in rendered:
-        print('  '.join(cols[i].ljust(col_widths[i]) for i in range(len(cols))))
+    # Buffer output and write it once rather than print() per row
+    if args.csv:
+        out = [','.join(x.lower().replace('(ms)','').replace('(bytes)','') for x in headers)]  # header row
+        out.extend(','.join(cols) for cols in rendered)
+        sys.stdout.write('\n'.join(out) + '\n')
+        return
+
+    fmt_str = '  '.join('{:<%d}' % w for w in col_widths)
+    out = [fmt_str.format(*headers)]
+    out.extend(fmt_str.format(*cols) for cols in rendered)
 
     if args.summary:
         meta = blob.get('meta', {})
         seed = meta.get('seed', 'unknown')
-        print(f"Summary: structures={len(rows)} seed={seed} size={meta.get('size','-')} runs={meta.get('runs','-')}")
+        out.append(f"Summary: structures={len(rendered)} seed={seed} size={meta.get('size','-')} runs={meta.get('runs','-')}")
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def render_series(blob: Dict[str, Any], args: argparse.Namespace):
@@ -132,7 +186,7 @@ def render_series(blob: Dict[str, Any], args: argparse.Namespace):
     print("Structure  LatestSize  MedianInsert(ms)")
     for st, info in latest_by_structure.items():
         vals = by_structure_values[st]
-        med = statistics.median(vals) if vals else None
+        med = median(vals) if vals else None
         print(f"{st:<10} {info['size']:<10} {fmt(med):<}")
 
 def render_crossover(blob: Dict[str, Any], args: argparse.Namespace):
@@ -145,6 +199,14 @@ def render_crossover(blob: Dict[str, Any], args: argparse.Namespace):
         print(f"{op:<9} {a},{b:<15} {size}")
 
 
+# Discriminator key -> renderer, checked in order (first list-valued key wins)
+RENDERERS = {
+    'results': render_benchmark,
+    'series': render_series,
+    'crossovers': render_crossover,
+}
+
+
 def main():
     ap = argparse.ArgumentParser(description="Parse hashbrowns benchmark JSON and print a summary table.")
     ap.add_argument('path', help='Path to benchmark_results.json / series_results.json / crossover_results.json')
@@ -156,12 +218,9 @@ def main():
     blob = load_json(args.path)
     if 'meta' in blob: validate_schema(blob)
 
-    if is_benchmark_blob(blob):
-        render_benchmark(blob, args); return
-    if is_series_blob(blob):
-        render_series(blob, args); return
-    if is_crossover_blob(blob):
-        render_crossover(blob, args); return
+    for key, render in RENDERERS.items():
+        if isinstance(blob, dict) and isinstance(blob.get(key), list):
+            render(blob, args); return
 
     print('error: unrecognized JSON format; expected benchmark, series, or crossover blob', file=sys.stderr)
     sys.exit(2)
@@ -1,33 +1,56 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import functools
+import operator
 import os
 import sys
 import platform
-from typing import List, Sequence
+from typing import Sequence
 import numpy as np
 
+# Import matplotlib once, pinned to the headless Agg backend (no GUI probing)
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+except Exception:
+    plt = None
+
 
 def require_matplotlib():
-    try:
-        import matplotlib  # noqa: F401
-        import matplotlib.pyplot as plt  # noqa: F401
-        return True
-    except Exception:
+    if plt is None:
         print("[ERROR] matplotlib is not installed. Install it with: pip install matplotlib", file=sys.stderr)
         return False
+    return True
 
 
-def read_csv(path):
-    rows = []
+def read_csv(path, columns: Sequence[str]):
+    # Stream the requested columns as tuples, one row at a time; yields
+    # nothing if the file is missing or lacks one of the columns
     if not os.path.exists(path):
         print(f"[ERROR] File not found: {path}", file=sys.stderr)
-        return rows
+        return
     with open(path, newline="") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            rows.append(r)
-    return rows
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        missing = [c for c in columns if c not in header]
+        if missing:
+            print(f"[ERROR] {path}: missing column(s) {', '.join(missing)}", file=sys.stderr)
+            return
+        get = operator.itemgetter(*(header.index(c) for c in columns))
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+            yield get(row)
+
+
+@functools.lru_cache(maxsize=1)
 def get_hw_summary() -> str:
     try:
         os_name = platform.system()
@@ -50,27 +73,62 @@ def get_hw_summary() -> str:
         return "(hardware info unavailable)"
 
 
-def _annotate(fig, notes: Sequence[str], include_hw: bool):
+@functools.lru_cache(maxsize=None)
+def _annotation_text(notes: Sequence[str], include_hw: bool) -> str:
     text = " | ".join(n for n in notes if n)
     if include_hw:
         hw = get_hw_summary()
         text = (text + (" | " if text else "")) + hw
+    return text
+
+
+def _annotate(fig, notes: Sequence[str], include_hw: bool):
+    text = _annotation_text(tuple(notes), include_hw)
     if text:
         fig.text(0.5, 0.01, text, ha='center', va='bottom', fontsize=8)
 
 
 
-def _auto_yscale(values: List[float], mode: str) -> str:
+def _fixed_layout(fig, top_in: float = 0.4, bottom_in: float = 0.65, hspace: float = 0.5):
+    # Fixed margins (in inches) instead of running tight_layout per figure;
+    # bottom leaves room for tick labels, the x label and the footer text
+    h = fig.get_figheight()
+    fig.subplots_adjust(left=0.1, right=0.97, top=1 - top_in / h, bottom=bottom_in / h, hspace=hspace)
+
+
+BENCH_COLUMNS = ('structure', 'insert_ms_mean', 'search_ms_mean', 'remove_ms_mean')
+CROSS_COLUMNS = ('operation', 'a', 'b', 'size_at_crossover')
+SERIES_COLUMNS = ('size', 'structure', 'insert_ms', 'search_ms', 'remove_ms')
+
+
+def bench_columns(rows):
+    # One pass over benchmark rows into struct-of-arrays columns shared by the bench plots
+    structures, insert, search, remove = [], [], [], []
+    for st, ins, sea, rem in rows:
+        structures.append(st)
+        insert.append(float(ins))
+        search.append(float(sea))
+        remove.append(float(rem))
+    return {
+        'structure': np.array(structures, dtype=str),
+        'insert': np.array(insert, dtype=np.float64),
+        'search': np.array(search, dtype=np.float64),
+        'remove': np.array(remove, dtype=np.float64),
+    }
+
+
+def _auto_yscale(values: Sequence[float], mode: str) -> str:
     if mode in ("linear", "log"):
         return mode
     if mode in ("mid", "asinh", "sqrt"):
         return mode
     # auto: pick log if spread is large
-    nonzero = [v for v in values if v > 0]
-    if not nonzero:
+    values = np.asarray(values, dtype=np.float64)
+    nonzero = values[values > 0]
+    if nonzero.size == 0:
         return "linear"
-    vmin = min(nonzero)
-    vmax = max(values) if values else 0.0
+    vmin = nonzero.min()
+    vmax = values.max()
     ratio = (vmax / vmin) if vmin > 0 else float('inf')
     # Choose a middle scale when range is wide but not extreme
     if ratio >= 50 and ratio < 5000:
@@ -78,11 +136,13 @@ def _auto_yscale(values: List[float], mode: str) -> str:
     return "log" if ratio >= 5000 else "linear"
 
 
-def _apply_scale(ax, values: List[float], yscale: str):
+def _apply_scale(ax, values: Sequence[float], yscale: str):
     scale = _auto_yscale(values, yscale)
     if scale == "log":
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > 0]
         ax.set_yscale('log')
-        ax.set_ylim(bottom=max(1e-3, min([v for v in values if v > 0] or [1e-3])))
+        ax.set_ylim(bottom=max(1e-3, positive.min() if positive.size else 1e-3))
     elif scale in ("mid", "asinh"):
         # "Middle" scale using arcsinh for gentler compression than log
         ax.set_yscale('function', functions=(np.arcsinh, np.sinh))
@@ -94,93 +154,81 @@ def _apply_scale(ax, values: List[float], yscale: str):
         ax.set_yscale('linear')
 
 
-def plot_bench(bench_rows, out_dir, yscale: str = "auto", notes: Sequence[str] = (), include_hw: bool = True):
-    import matplotlib.pyplot as plt
-
-    if not bench_rows:
+def plot_bench(bench, out_dir, yscale: str = "auto", notes: Sequence[str] = (), include_hw: bool = True):
+    structures = bench['structure']
+    if structures.size == 0:
         print("[WARN] No benchmark rows to plot")
         return
 
-    structures = [r['structure'] for r in bench_rows]
-    insert = [float(r['insert_ms_mean']) for r in bench_rows]
-    search = [float(r['search_ms_mean']) for r in bench_rows]
-    remove = [float(r['remove_ms_mean']) for r in bench_rows]
+    insert, search, remove = bench['insert'], bench['search'], bench['remove']
 
-    x = range(len(structures))
+    x = np.arange(len(structures))
     width = 0.25
 
     fig, ax = plt.subplots(figsize=(8, 4))
-    ax.bar([i - width for i in x], insert, width, label='insert')
+    ax.bar(x - width, insert, width, label='insert')
     ax.bar(x, search, width, label='search')
-    ax.bar([i + width for i in x], remove, width, label='remove')
+    ax.bar(x + width, remove, width, label='remove')
 
-    ax.set_xticks(list(x))
+    ax.set_xticks(x)
     ax.set_xticklabels(structures)
     # y-scale (auto/mid/log) for readability
-    all_vals = insert + search + remove
+    all_vals = np.concatenate((insert, search, remove))
     _apply_scale(ax, all_vals, yscale)
     ax.set_ylabel('ms (mean)')
     ax.set_title('Benchmark summary')
     ax.legend()
-    fig.tight_layout(rect=[0, 0.04, 1, 0.97])
+    _fixed_layout(fig)
     _annotate(fig, notes, include_hw)
 
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, 'benchmark_summary.png')
     fig.savefig(out_path, dpi=150)
+    plt.close(fig)
     print(f"[INFO] Wrote {out_path}")
 
 
-def plot_bench_by_operation(bench_rows, out_dir, yscale: str = "auto", notes: Sequence[str] = (), include_hw: bool = True):
-    import matplotlib.pyplot as plt
-
-    if not bench_rows:
+def plot_bench_by_operation(bench, out_dir, yscale: str = "auto", notes: Sequence[str] = (), include_hw: bool = True):
+    structures = bench['structure']
+    if structures.size == 0:
         print("[WARN] No benchmark rows to plot (by operation)")
         return
 
-    structures = [r['structure'] for r in bench_rows]
-    ops = {
-        'insert': [float(r['insert_ms_mean']) for r in bench_rows],
-        'search': [float(r['search_ms_mean']) for r in bench_rows],
-        'remove': [float(r['remove_ms_mean']) for r in bench_rows],
-    }
+    ops = {op: bench[op] for op in ('insert', 'search', 'remove')}
+    x = np.arange(len(structures))
 
     fig, axes = plt.subplots(nrows=3, ncols=1, figsize=(8, 9), squeeze=True)
     for ax, (op, vals) in zip(axes, ops.items()):
-        ax.bar(range(len(structures)), vals, width=0.6)
-        ax.set_xticks(list(range(len(structures))))
+        ax.bar(x, vals, width=0.6)
+        ax.set_xticks(x)
         ax.set_xticklabels(structures)
         _apply_scale(ax, vals, yscale)
         ax.set_ylabel('ms (mean)')
         ax.set_title(op)
         ax.grid(True, axis='y', linestyle='--', alpha=0.3)
     fig.suptitle('Benchmark by operation', y=0.98)
-    fig.tight_layout(rect=[0, 0.04, 1, 0.97])
+    _fixed_layout(fig, top_in=0.75, bottom_in=0.55)
     _annotate(fig, notes, include_hw)
 
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, 'benchmark_by_operation.png')
     fig.savefig(out_path, dpi=150)
+    plt.close(fig)
     print(f"[INFO] Wrote {out_path}")
 
 
 def plot_crossovers(cross_rows, out_dir, notes: Sequence[str] = (), include_hw: bool = True):
-    import matplotlib.pyplot as plt
-
-    if not cross_rows:
-        print("[WARN] No crossover rows to plot")
-        return
-
     # Group by operation; show points at size_at_crossover
     ops = {}
-    for r in cross_rows:
+    for op, a, b, size in cross_rows:
         try:
-            op = r['operation']
-            size = int(float(r['size_at_crossover']))
-            pair = f"{r['a']} vs {r['b']}"
-            ops.setdefault(op, []).append((size, pair))
+            size = int(float(size))
         except Exception:
-            pass
+            continue
+        ops.setdefault(op, []).append((size, f"{a} vs {b}"))
+    if not ops:
+        print("[WARN] No crossover rows to plot")
+        return
 
     fig, axes = plt.subplots(nrows=len(ops), ncols=1, figsize=(8, 3 * max(1, len(ops))), squeeze=False)
     for ax, (op, lst) in zip(axes[:, 0], ops.items()):
@@ -194,12 +242,13 @@ def plot_crossovers(cross_rows, out_dir, notes: Sequence[str] = (), include_hw:
         ax.set_xlabel('elements')
         ax.get_yaxis().set_visible(False)
         ax.grid(True, axis='x', linestyle='--', alpha=0.3)
-    fig.tight_layout(rect=[0, 0.04, 1, 0.97])
+    _fixed_layout(fig, hspace=0.7)
     _annotate(fig, notes, include_hw)
 
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, 'crossover_points.png')
     fig.savefig(out_path, dpi=150)
+    plt.close(fig)
     print(f"[INFO] Wrote {out_path}")
 
 
@@ -217,40 +266,36 @@ def main():
     if not require_matplotlib():
         return 1
 
-    bench = read_csv(args.bench_csv) if args.bench_csv else []
-    cross = read_csv(args.cross_csv) if args.cross_csv else []
+    bench = bench_columns(read_csv(args.bench_csv, BENCH_COLUMNS) if args.bench_csv else ())
 
-    if bench:
+    if bench['structure'].size:
         plot_bench(bench, args.out_dir, yscale=args.yscale, notes=args.note, include_hw=not args.no_hw)
         plot_bench_by_operation(bench, args.out_dir, yscale=args.yscale, notes=args.note, include_hw=not args.no_hw)
-    if cross:
-        plot_crossovers(cross, args.out_dir, notes=args.note, include_hw=not args.no_hw)
+    if args.cross_csv:
+        plot_crossovers(read_csv(args.cross_csv, CROSS_COLUMNS), args.out_dir, notes=args.note, include_hw=not args.no_hw)
 
     if args.series_csv:
-        series = read_csv(args.series_csv)
-        if series:
-            try:
-                import matplotlib.pyplot as plt
-            except Exception:
-                print("[ERROR] matplotlib not available for series plots", file=sys.stderr)
-                return 1
-            # Build plots by operation across sizes per structure
-            ops = ['insert_ms', 'search_ms', 'remove_ms']
-            sizes = sorted({int(float(r['size'])) for r in series})
-            structures = sorted({r['structure'] for r in series})
-            data = {op: {st: [] for st in structures} for op in ops}
-            # Group values in size order
-            by_size = {s: [r for r in series if int(float(r['size'])) == s] for s in sizes}
-            for s in sizes:
-                rows = by_size[s]
-                for st in structures:
-                    row = next((r for r in rows if r['structure'] == st), None)
-                    for op in ops:
-                        val = float(row[op]) if row else float('nan')
-                        data[op][st].append(val)
-            # One figure per operation
+        # Build plots by operation across sizes per structure
+        ops = SERIES_COLUMNS[2:]
+        # Stream rows into a (size, structure) index; first row wins
+        idx = {}
+        for size, st, *vals in read_csv(args.series_csv, SERIES_COLUMNS):
+            key = (int(float(size)), st)
+            if key not in idx:
+                idx[key] = tuple(float(v) for v in vals)
+        if idx:
+            sizes = sorted({s for s, _ in idx})
+            structures = sorted({st for _, st in idx})
+            nan = float('nan')
+            data = {
+                op: {st: [idx[(s, st)][i] if (s, st) in idx else nan for s in sizes] for st in structures}
+                for i, op in enumerate(ops)
+            }
+            # One PNG per operation, redrawing a single reused figure
+            fig = plt.figure(figsize=(8,4))
             for op in ops:
-                fig, ax = plt.subplots(figsize=(8,4))
+                fig.clear()
+                ax = fig.add_subplot()
                 all_vals = []
                 for st in structures:
                     y = data[op][st]
@@ -262,12 +307,13 @@ def main():
                 ax.set_ylabel("ms (mean)")
                 ax.grid(True, linestyle='--', alpha=0.3)
                 ax.legend()
-                fig.tight_layout(rect=[0, 0.04, 1, 0.97])
+                _fixed_layout(fig)
                 _annotate(fig, args.note, not args.no_hw)
                 os.makedirs(args.out_dir, exist_ok=True)
                 out_path = os.path.join(args.out_dir, f"series_{op.replace('_ms','')}.png")
                 fig.savefig(out_path, dpi=150)
                 print(f"[INFO] Wrote {out_path}")
+            plt.close(fig)
     return 0
 
 
@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import contextlib
+import io
 import json
 import subprocess
 import sys
@@ -10,13 +12,20 @@ VALIDATOR = ROOT / 'scripts' / 'validate_json.py'
 SCHEMA_DIR = ROOT / 'docs' / 'api' / 'schemas'
 
 
+def import_validator():
+    if str(VALIDATOR.parent) not in sys.path:
+        sys.path.insert(0, str(VALIDATOR.parent))
+    import validate_json
+    return validate_json
+
+
 def write_json(path: Path, obj):
     path.write_text(json.dumps(obj, indent=2) + '\n', encoding='utf-8')
 
 
-def run_validator(path: Path):
+def run_validator(*paths: Path, jobs: int = 1, schema_dir: Path = SCHEMA_DIR):
     return subprocess.run(
-        [sys.executable, str(VALIDATOR), '--schema-dir', str(SCHEMA_DIR), str(path)],
+        [sys.executable, str(VALIDATOR), '--schema-dir', str(schema_dir), '--jobs', str(jobs), *map(str, paths)],
         capture_output=True,
         text=True,
     )
@@ -100,6 +109,26 @@ def test_detects_series_schema():
         assert 'series_results.schema.json' in proc.stdout, proc.stdout
 
 
+def test_accepts_nan_literals_like_json_module():
+    # json.dumps emits NaN; parsing must not depend on whether orjson is installed
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / 'series_nan.json'
+        write_json(path, {
+            'meta': {
+                'schema_version': 1,
+                'runs_per_size': 1,
+                'structures': ['array'],
+                'pattern': 'sequential',
+                'profile': 'series',
+                'profile_manifest': {'selected_profile': 'series', 'applied_defaults': [], 'explicit_overrides': []}
+            },
+            'series': [{'size': 16, 'structure': 'array', 'insert_ms': float('nan'), 'search_ms': 1.0, 'remove_ms': 1.0}]
+        })
+        proc = run_validator(path)
+        assert proc.returncode == 0, proc.stderr + proc.stdout
+        assert 'series_results.schema.json' in proc.stdout, proc.stdout
+
+
 def test_detects_crossover_schema():
     with tempfile.TemporaryDirectory() as td:
         path = Path(td) / 'crossover.json'
@@ -129,6 +158,156 @@ def test_detects_crossover_schema():
         assert 'crossover_results.schema.json' in proc.stdout, proc.stdout
 
 
+def test_reuses_schema_across_multiple_files():
+    with tempfile.TemporaryDirectory() as td:
+        good = Path(td) / 'crossover_a.json'
+        bad = Path(td) / 'crossover_b.json'
+        blob = {
+            'meta': {
+                'schema_version': 1,
+                'size': 16,
+                'runs': 1,
+                'structures': ['array', 'hashmap'],
+                'pattern': 'sequential',
+                'timestamp': '2026-01-01T00:00:00Z',
+                'git_commit': 'abc',
+                'compiler': 'GCC',
+                'cpp_standard': 'C++17',
+                'build_type': 'Release',
+                'cpu_model': 'CPU',
+                'profile': 'crossover',
+                'cores': 1,
+                'total_ram_bytes': 1,
+                'kernel': 'Linux',
+                'profile_manifest': {'selected_profile': 'crossover', 'applied_defaults': [], 'explicit_overrides': []}
+            },
+            'crossovers': [{'operation': 'insert', 'a': 'array', 'b': 'hashmap', 'size_at_crossover': 1024}]
+        }
+        write_json(good, blob)
+        blob['crossovers'][0]['size_at_crossover'] = 'many'
+        write_json(bad, blob)
+        for jobs in (1, 2):
+            proc = run_validator(good, bad, good, jobs=jobs)
+            assert proc.returncode == 1, proc.stderr + proc.stdout
+            assert proc.stdout.count('crossover_a.json -> crossover_results.schema.json') == 2, proc.stdout
+            assert 'crossover_b.json' in proc.stderr, proc.stderr
+
+
+def test_parallel_run_spreads_files_across_workers():
+    # Record what main() hands the executor instead of spawning processes,
+    # so the check is deterministic and independent of the start method
+    vj = import_validator()
+    calls = []
+
+    class RecordingExecutor:
+        def __init__(self, max_workers):
+            calls.append({'max_workers': max_workers})
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, *iterables, chunksize=1):
+            calls[-1]['chunksize'] = chunksize
+            return map(fn, *iterables)
+
+    def run(jobs, n_files):
+        calls.clear()
+        files = [f'f{i}.json' for i in range(n_files)]
+        sys.argv = ['validate_json.py', '--jobs', str(jobs), *files]
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            try:
+                vj.main()
+            except SystemExit as e:
+                assert e.code == 0, e.code
+        assert out.getvalue().splitlines() == files
+        return calls[0] if calls else None
+
+    saved = (sys.argv, vj.ProcessPoolExecutor, vj.validate_one)
+    vj.ProcessPoolExecutor = RecordingExecutor
+    vj.validate_one = lambda path, schema_dir: (True, path)
+    try:
+        for jobs, n_files, workers in ((2, 3, 2), (4, 8, 4), (4, 100, 4), (8, 3, 3)):
+            call = run(jobs, n_files)
+            assert call['max_workers'] == workers, (jobs, n_files, call)
+            chunks = -(-n_files // call['chunksize'])
+            assert chunks >= workers, (jobs, n_files, call)
+        assert run(1, 3) is None
+        assert run(4, 1) is None
+    finally:
+        sys.argv, vj.ProcessPoolExecutor, vj.validate_one = saved
+
+
+def test_fast_path_matches_jsonschema_on_draft07():
+    vj = import_validator()
+    schema = {
+        '$schema': 'http://json-schema.org/draft-07/schema#',
+        'type': 'object',
+        'required': ['n'],
+        'properties': {
+            'n': {'type': 'integer', 'minimum': 0},
+            'when': {'type': 'string', 'format': 'date-time'},
+        },
+        'additionalProperties': False,
+    }
+    cases = [
+        {'n': 1},
+        {'n': 1, 'when': 'not a date'},
+        {'n': 1, 'when': '2026-01-01T00:00:00Z'},
+        {'n': -1},
+        {'n': 'x'},
+        {'n': True},
+        {'n': 1, 'extra': 0},
+        {},
+    ]
+
+    def passes(validate, obj):
+        try:
+            validate(obj)
+            return True
+        except Exception:
+            return False
+
+    fast_module = vj.fastjsonschema
+    try:
+        fast = vj.compile_schema(schema)
+        vj.fastjsonschema = None
+        reference = vj.compile_schema(schema)
+    finally:
+        vj.fastjsonschema = fast_module
+    if fast_module is not None:
+        assert fast.__qualname__ != reference.__qualname__, 'draft-07 schema should take the fastjsonschema path'
+    for obj in cases:
+        assert passes(fast, obj) == passes(reference, obj), obj
+
+
+def test_enforces_draft_2020_12_keywords():
+    with tempfile.TemporaryDirectory() as td:
+        schema_dir = Path(td) / 'schemas'
+        schema_dir.mkdir()
+        schema_path = schema_dir / 'crossover_results.schema.json'
+        path = Path(td) / 'crossover.json'
+        write_json(path, {'crossovers': ['x']})
+        schema = {
+            '$schema': 'https://json-schema.org/draft/2020-12/schema',
+            'type': 'object',
+            'properties': {'crossovers': {'type': 'array', 'prefixItems': [{'type': 'integer'}]}},
+        }
+        write_json(schema_path, schema)
+        proc = run_validator(path, schema_dir=schema_dir)
+        assert proc.returncode == 1, proc.stderr + proc.stdout
+        assert 'is not of type' in proc.stderr, proc.stderr
+
+        # A malformed schema must still be rejected up front
+        schema['properties']['crossovers']['prefixItems'] = []
+        write_json(schema_path, schema)
+        proc = run_validator(path, schema_dir=schema_dir)
+        assert proc.returncode == 1, proc.stderr + proc.stdout
+        assert '[FAIL]' in proc.stderr, proc.stderr
+
+
 def test_detects_baseline_report_schema():
     with tempfile.TemporaryDirectory() as td:
         path = Path(td) / 'baseline_report.json'
@@ -271,7 +450,12 @@ def test_rejects_unrecognized_json():
 def main():
     test_detects_benchmark_results_schema()
     test_detects_series_schema()
+    test_accepts_nan_literals_like_json_module()
     test_detects_crossover_schema()
+    test_reuses_schema_across_multiple_files()
+    test_parallel_run_spreads_files_across_workers()
+    test_fast_path_matches_jsonschema_on_draft07()
+    test_enforces_draft_2020_12_keywords()
     test_detects_baseline_report_schema()
     test_detects_profile_contract_schema()
     test_detects_perf_guard_contract_schema()
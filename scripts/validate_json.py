@@ -3,7 +3,8 @@ import argparse
 import json
 import os
 import sys
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Tuple
 
 try:
     import jsonschema  # type: ignore
@@ -11,48 +12,127 @@ except Exception:
     print("[ERROR] jsonschema is not installed. Install with: pip install jsonschema", file=sys.stderr)
     sys.exit(2)
 
+try:
+    import orjson  # type: ignore  # optional faster parser
+except Exception:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    # orjson is stricter than json (no NaN/Infinity, 64-bit ints only), so
+    # anything it rejects is re-parsed with json to keep the same verdicts
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 def load(path: str):
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
+try:
+    import fastjsonschema  # type: ignore  # optional code-generating validator
+except Exception:
+    fastjsonschema = None
+
+
+_VALIDATORS: Dict[str, Callable[[Any], Any]] = {}
+
+
+# fastjsonschema implements only these drafts; it compiles anything else
+# (e.g. 2020-12) as draft-07 and silently ignores newer keywords
+_FAST_DRAFTS = ('/draft-04/', '/draft-06/', '/draft-07/')
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    # Prefer fastjsonschema's generated validator for drafts it supports;
+    # use jsonschema for everything else or when it rejects a keyword
+    draft = schema.get('$schema', '') if isinstance(schema, dict) else ''
+    if fastjsonschema is not None and any(d in draft for d in _FAST_DRAFTS):
+        try:
+            # jsonschema treats `format` as an annotation; match that here
+            return fastjsonschema.compile(schema, use_formats=False)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            pass
+    validator = cls(schema)
+
+    def validate(obj):
+        error = jsonschema.exceptions.best_match(validator.iter_errors(obj))
+        if error is not None:
+            raise error
+    return validate
+
+
+def get_validator(schema_path: str) -> Callable[[Any], Any]:
+    # Compile each schema once and reuse the validator across files
+    validator = _VALIDATORS.get(schema_path)
+    if validator is None:
+        validator = compile_schema(load(schema_path))
+        _VALIDATORS[schema_path] = validator
+    return validator
+
+
+# Discriminator keys -> schema, checked in order (first match wins)
+_SCHEMA_RULES = (
+    (frozenset({'results'}), 'benchmark_results.schema.json'),
+    (frozenset({'series'}), 'series_results.schema.json'),
+    (frozenset({'crossovers'}), 'crossover_results.schema.json'),
+    (frozenset({'metadata', 'comparison', 'baseline_path'}), 'baseline_report.schema.json'),
+    (frozenset({'schema_version', 'profiles'}), 'profiles.schema.json'),
+    (frozenset({'schema_version', 'wrapper', 'report'}), 'perf_guard_contract.schema.json'),
+    (frozenset({'schema_version', 'metadata', 'strict_profile_intent', 'comparison', 'report_exit_codes'}), 'baseline_policy.schema.json'),
+)
 
 
 def detect_schema(obj: Dict[str, object]) -> str:
     # Heuristic: top-level keys decide which schema to apply
-    if 'results' in obj:
-        return 'benchmark_results.schema.json'
-    if 'series' in obj:
-        return 'series_results.schema.json'
-    if 'crossovers' in obj:
-        return 'crossover_results.schema.json'
-    if 'metadata' in obj and 'comparison' in obj and 'baseline_path' in obj:
-        return 'baseline_report.schema.json'
-    if 'schema_version' in obj and 'profiles' in obj:
-        return 'profiles.schema.json'
-    if 'schema_version' in obj and 'wrapper' in obj and 'report' in obj:
-        return 'perf_guard_contract.schema.json'
-    if 'schema_version' in obj and 'metadata' in obj and 'strict_profile_intent' in obj and 'comparison' in obj and 'report_exit_codes' in obj:
-        return 'baseline_policy.schema.json'
+    keys = obj.keys() if isinstance(obj, dict) else set()
+    for required, schema_name in _SCHEMA_RULES:
+        if keys >= required:
+            return schema_name
     raise ValueError('Unrecognized JSON structure (missing results/series/crossovers, baseline report fields, profile contract fields, perf guard contract fields, or baseline policy fields)')
 
 
+def validate_one(path: str, schema_dir: str) -> Tuple[bool, str]:
+    # Runs in worker processes too; each keeps its own _VALIDATORS cache
+    try:
+        obj = load(path)
+        schema_name = detect_schema(obj)
+        get_validator(os.path.join(schema_dir, schema_name))(obj)
+        return True, f"[OK] {os.path.basename(path)} -> {schema_name}"
+    except Exception as e:
+        return False, f"[FAIL] {path}: {e}"
+
+
 def main():
     ap = argparse.ArgumentParser(description='Validate hashbrowns JSON with JSON Schema')
     ap.add_argument('--schema-dir', default=os.path.join('docs','api','schemas'))
+    ap.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes for multi-file runs (default: CPU count; 1 = serial)')
     ap.add_argument('files', nargs='+', help='JSON files to validate')
     args = ap.parse_args()
 
+    schema_dirs = [args.schema_dir] * len(args.files)
+    if args.jobs > 1 and len(args.files) > 1:
+        workers = min(args.jobs, len(args.files))
+        # Several chunks per worker so small batches still spread out
+        chunksize = max(1, len(args.files) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(validate_one, args.files, schema_dirs, chunksize=chunksize))
+    else:
+        results = list(map(validate_one, args.files, schema_dirs))
+
     ok = True
-    for path in args.files:
-        try:
-            obj = load(path)
-            schema_name = detect_schema(obj)
-            schema_path = os.path.join(args.schema_dir, schema_name)
-            schema = load(schema_path)
-            jsonschema.validate(instance=obj, schema=schema)
-            print(f"[OK] {os.path.basename(path)} -> {schema_name}")
-        except Exception as e:
-            print(f"[FAIL] {path}: {e}", file=sys.stderr)
+    for passed, message in results:
+        if passed:
+            print(message)
+        else:
+            print(message, file=sys.stderr)
             ok = False
     sys.exit(0 if ok else 1)
 